@@ -3,8 +3,49 @@
 Extract and format error message from validation result JSON.
 """
 import json
+import re
 import sys
 
+_MISSING_FIELDS_RE = re.compile(r"Missing required fields: (\[.*?\])")
+
+
+def _fmt_not_found(error):
+    return 'Instance ID not found in SWE-bench dataset'
+
+
+def _fmt_missing(error):
+    # Extract which fields are missing
+    if "['patch']" in error:
+        return 'Missing required field: patch'
+    match = _MISSING_FIELDS_RE.search(error)
+    if match:
+        fields = match.group(1)
+        return f'Missing required fields: {fields}'
+    return 'Missing required fields'
+
+
+def _fmt_not_resolved(error):
+    return 'Patch did not resolve the issue (tests still failing)'
+
+
+def _fmt_timeout(error):
+    return 'Validation timed out'
+
+
+def _fmt_docker(error):
+    return 'Docker execution error'
+
+
+# Lowercase needles checked in order against the lowercased error
+DISPATCH = [
+    ('not found in swe-bench dataset', _fmt_not_found),
+    ('missing required fields', _fmt_missing),
+    ('patch did not resolve the issue', _fmt_not_resolved),
+    ('timeout', _fmt_timeout),
+    ('docker', _fmt_docker),
+]
+
+
 def extract_error(result_file):
     """Extract error message with simple, readable formatting."""
     try:
@@ -18,39 +59,20 @@ def extract_error(result_file):
             error = error.strip()
             
             # Create simple, readable error messages
-            if 'not found in SWE-bench dataset' in error:
-                return 'Instance ID not found in SWE-bench dataset'
-            
-            elif 'Missing required fields' in error:
-                # Extract which fields are missing
-                if "['patch']" in error:
-                    return 'Missing required field: patch'
-                elif 'Missing required fields:' in error:
-                    import re
-                    match = re.search(r"Missing required fields: (\[.*?\])", error)
-                    if match:
-                        fields = match.group(1)
-                        return f'Missing required fields: {fields}'
-                return 'Missing required fields'
-            
-            elif 'Patch did not resolve the issue' in error:
-                return 'Patch did not resolve the issue (tests still failing)'
-            
-            elif 'timeout' in error.lower():
-                return 'Validation timed out'
-            
-            elif 'docker' in error.lower():
-                return 'Docker execution error'
+            error_l = error.lower()
+            for needle, fmt in DISPATCH:
+                if error_l.find(needle) >= 0:
+                    return fmt(error)
             
+            # Fallback: use first sentence or line
+            first_line = error.partition('\n')[0]
+            head, sep, _ = first_line.partition('. ')
+            if sep:
+                first_sentence = head + '.'
+                return first_sentence if len(first_sentence) <= 100 else first_line[:80] + '...'
             else:
-                # Fallback: use first sentence or line
-                first_line = error.split('\n')[0]
-                if '. ' in first_line:
-                    first_sentence = first_line.split('. ')[0] + '.'
-                    return first_sentence if len(first_sentence) <= 100 else first_line[:80] + '...'
-                else:
-                    return first_line[:80] + ('...' if len(first_line) > 80 else '')
-                
+                return first_line[:80] + ('...' if len(first_line) > 80 else '')
+            
     except Exception as e:
         return f'Error reading result file'
 
@@ -0,0 +1,38 @@
+"""
+JSON backend for SWE-bench validator.
+
+Uses orjson when it is installed (``pip install .[fast]``) and falls back to
+the standard library otherwise. Both backends take and produce bytes.
+
+``dumps`` always produces ASCII-only output (non-ASCII characters are
+``\\u``-escaped) so files can be read back regardless of locale encoding.
+
+The backends differ on edge cases: orjson rejects ``NaN``/``Infinity`` and
+integers wider than 64 bits, which the standard library accepts.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to ASCII-only JSON bytes."""
+        data = orjson.dumps(obj)
+        # orjson has no ensure_ascii; escape non-ASCII output via the stdlib
+        return data if data.isascii() else json.dumps(obj).encode("ascii")
+
+except ImportError:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to ASCII-only JSON bytes."""
+        return json.dumps(obj).encode("ascii")
@@ -4,6 +4,7 @@ Command-line interface for SWE-bench data point validator.
 
 import click
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from .validator import SWEBenchValidator, ValidationResult
@@ -18,6 +19,7 @@ def cli(ctx, verbose, log_file):
     """SWE-bench Data Point Validator CLI"""
     ctx.ensure_object(dict)
     ctx.obj['verbose'] = verbose
+    ctx.obj['log_file'] = log_file
     
     # Setup logging
     setup_logging(verbose=verbose, log_file=log_file)
@@ -78,41 +80,78 @@ def validate_directory(ctx, directory, pattern, timeout):
     
     # Create config
     config = ValidationConfig()
+    config.max_workers = min(config.max_workers, len(files))
+    config.concurrent = config.max_workers > 1
     if timeout:
         config.default_timeout = timeout
     
-    # Create validator
-    validator = SWEBenchValidator(config)
-    
     click.echo(f"Found {len(files)} data point files")
-    click.echo("Using SWE-bench evaluation harness...")
-    
-    # Validate each file
-    results = []
-    for i, file_path in enumerate(files, 1):
-        click.echo(f"\n[{i}/{len(files)}] Validating: {file_path.name}")
-        result = validator.validate_single_file(file_path)
-        results.append(result)
-        
-        if result.success:
-            click.echo(f"   ✅ PASSED")
-        else:
-            click.echo(f"   ❌ FAILED: {result.error_message}")
+    click.echo(f"Using SWE-bench evaluation harness ({config.max_workers} workers)...")
+    
+    # Validate files in parallel, keeping only counts and failed names
+    passed = 0
+    failed = 0
+    failed_names = []
+    # Workers set up their own logging; under spawn/forkserver they do not
+    # inherit the parent's handlers
+    with ProcessPoolExecutor(
+        max_workers=config.max_workers,
+        initializer=setup_logging,
+        initargs=(ctx.obj['verbose'], ctx.obj['log_file'])
+    ) as executor:
+        futures = {
+            executor.submit(_validate_one, str(file_path), config): file_path
+            for file_path in files
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            file_path = futures.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool when a worker is killed
+                result = ValidationResult(
+                    instance_id=file_path.stem,
+                    success=False,
+                    error_message=f"Validation worker failed: {e}"
+                )
+            
+            click.echo(f"\n[{i}/{len(files)}] Validated: {file_path.name}")
+            if result.success:
+                passed += 1
+                click.echo(f"   ✅ PASSED")
+            else:
+                failed += 1
+                failed_names.append(result.instance_id)
+                click.echo(f"   ❌ FAILED: {result.error_message}")
+    
+    # Workers keep their Docker images while others may still use them
+    if config.concurrent:
+        try:
+            SWEBenchValidator(config).clean_harness_images()
+        except Exception as e:
+            click.echo(f"Warning: Docker image cleanup failed: {e}", err=True)
     
     # Summary
-    passed = sum(1 for r in results if r.success)
-    failed = len(results) - passed
+    total = passed + failed
     
     click.echo(f"\n📊 Summary:")
-    click.echo(f"   Total: {len(results)}")
+    click.echo(f"   Total: {total}")
     click.echo(f"   Passed: {passed}")
     click.echo(f"   Failed: {failed}")
-    click.echo(f"   Success Rate: {passed/len(results)*100:.1f}%")
+    click.echo(f"   Success Rate: {passed/total*100:.1f}%")
+    for name in failed_names:
+        click.echo(f"   ❌ {name}")
     
     if failed > 0:
         sys.exit(1)
 
 
+def _validate_one(path_str: str, config: ValidationConfig) -> ValidationResult:
+    """Validate a single file in a worker process."""
+    validator = SWEBenchValidator(config)
+    return validator.validate_single_file(Path(path_str))
+
+
 def main():
     """Main entry point for CLI."""
     cli()
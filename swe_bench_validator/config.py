@@ -2,7 +2,9 @@
 Configuration settings for SWE-bench validator.
 """
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -16,7 +18,8 @@ class ValidationConfig:
     timeout_overrides: Optional[Dict[str, int]] = None
     
     # Resource limits
-    max_workers: int = 1  # Conservative default for stability
+    max_workers: int = min(os.cpu_count() or 1, 4)  # Data points validated in parallel
+    concurrent: bool = False  # Set when harness runs share Docker with other workers
     
     # Directories
     temp_dir: Path = Path("/tmp/swebench-validation")
@@ -43,8 +46,14 @@ class ValidationConfig:
     
     def get_timeout_for_instance(self, instance_id: str) -> int:
         """Get timeout for specific instance based on repository."""
-        repo = instance_id.split("__")[0] if "__" in instance_id else "default"
-        return self.timeout_overrides.get(repo, self.default_timeout)
+        return self.timeout_overrides.get(_repo_of(instance_id), self.default_timeout)
+
+
+@lru_cache(maxsize=1024)
+def _repo_of(instance_id: str) -> str:
+    """Get the repository prefix of an instance ID (e.g. "django__django-123")."""
+    repo, sep, _ = instance_id.partition("__")
+    return repo if sep else "default"
 
 
 # Default configuration instance
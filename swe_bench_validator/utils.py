@@ -2,13 +2,23 @@
 Utility functions for SWE-bench validator.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Union
 
+from . import _json
+
 logger = logging.getLogger(__name__)
 
+# Required fields according to SWE-bench format
+_REQUIRED_FIELDS = (
+    'instance_id', 'repo', 'base_commit', 'patch',
+    'FAIL_TO_PASS', 'PASS_TO_PASS'
+)
+_REQUIRED_SET = frozenset(_REQUIRED_FIELDS)
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 
 def load_data_point(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -22,33 +32,32 @@ def load_data_point(file_path: Union[str, Path]) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
-        ValueError: If required fields are missing
+        ValueError: If file contains invalid JSON or required fields are missing
     """
     file_path = Path(file_path)
     
     if not file_path.exists():
         raise FileNotFoundError(f"Data point file not found: {file_path}")
     
+    # Decode straight from raw bytes, skipping the text-mode str intermediate
+    raw = file_path.read_bytes()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = _json.loads(raw)
+    except ValueError as e:
         raise ValueError(f"Invalid JSON in {file_path}: {e}")
     
-    # Validate required fields according to SWE-bench format
-    required_fields = [
-        'instance_id', 'repo', 'base_commit', 'patch',
-        'FAIL_TO_PASS', 'PASS_TO_PASS'
-    ]
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid SWE-bench data point in {file_path}: expected a JSON object")
     
-    missing_fields = [field for field in required_fields if field not in data]
-    if missing_fields:
+    # Validate required fields according to SWE-bench format
+    missing = _REQUIRED_SET - data.keys()
+    if missing:
+        missing_fields = [field for field in _REQUIRED_FIELDS if field in missing]
         error_msg = f"Invalid SWE-bench data point in {file_path}:\n"
         error_msg += f"Missing required fields: {missing_fields}\n\n"
         error_msg += "Required fields for SWE-bench data points:\n"
-        for field in required_fields:
-            if field in missing_fields:
+        for field in _REQUIRED_FIELDS:
+            if field in missing:
                 error_msg += f"  ❌ {field} - MISSING\n"
             else:
                 error_msg += f"  ✅ {field} - present\n"
@@ -96,15 +105,17 @@ def parse_test_list(test_string: Union[str, List[str]]) -> List[str]:
         return test_string
     
     if isinstance(test_string, str):
+        test_string = test_string.strip()
+        
         # Handle JSON string format like '["test1", "test2"]'
-        if test_string.startswith('[') and test_string.endswith(']'):
+        if test_string[:1] == '[' and test_string[-1:] == ']':
             try:
-                return json.loads(test_string)
-            except json.JSONDecodeError:
+                return _json.loads(test_string)
+            except ValueError:
                 pass
         
         # Handle comma-separated format
-        return [test.strip() for test in test_string.split(',') if test.strip()]
+        return list(filter(None, map(str.strip, test_string.split(','))))
     
     return []
 
@@ -119,11 +130,12 @@ def setup_logging(verbose: bool = False, log_file: Path = None) -> None:
     """
     level = logging.DEBUG if verbose else logging.INFO
     
-    # Configure root logger
+    # Configure root logger, replacing handlers from any previous call
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format=_LOG_FORMAT,
+        datefmt='%Y-%m-%d %H:%M:%S',
+        force=True
     )
     
     # Add file handler if specified
@@ -131,8 +143,5 @@ def setup_logging(verbose: bool = False, log_file: Path = None) -> None:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
         logging.getLogger().addHandler(file_handler)
@@ -4,20 +4,55 @@ Core SWE-bench data point validator implementation.
 Uses the official SWE-bench evaluation harness to validate data points.
 """
 
-import json
 import logging
+import os
 import tempfile
+from hashlib import blake2b
 from pathlib import Path
 from typing import Dict, Any, Optional
+from uuid import uuid4
 
-# SWE-bench imports - REAL evaluation harness
-from swebench.harness.run_evaluation import main as run_evaluation
-
+from . import _json
 from .config import ValidationConfig, DEFAULT_CONFIG
 from .utils import load_data_point, convert_to_prediction_format, parse_test_list
 
 logger = logging.getLogger(__name__)
 
+# Detailed error messages for evaluation harness failures
+_ERR_NOT_FOUND_TMPL = (
+    "Instance ID '{instance_id}' not found in SWE-bench dataset.\n\n"
+    "This error occurs when:\n"
+    "  • The instance_id doesn't exist in the official SWE-bench dataset\n"
+    "  • There's a typo in the instance_id field\n"
+    "  • You're using a custom instance_id not from SWE-bench\n\n"
+    "Solution:\n"
+    "  • Use an existing instance_id from SWE-bench dataset\n"
+    "  • Check the instance_id spelling and format\n"
+    "  • Original error: {error_str}"
+)
+
+_ERR_TIMEOUT_TMPL = (
+    "SWE-bench evaluation timed out after {timeout}s.\n\n"
+    "This error occurs when:\n"
+    "  • Tests take too long to execute\n"
+    "  • Docker container becomes unresponsive\n"
+    "  • Repository has complex dependencies\n\n"
+    "Solution:\n"
+    "  • Increase timeout with --timeout option\n"
+    "  • Check Docker resources (CPU, memory)\n"
+    "  • Original error: {error_str}"
+)
+
+_ERR_GENERIC_TMPL = (
+    "SWE-bench evaluation failed.\n\n"
+    "Common causes:\n"
+    "  • Docker not running or not accessible\n"
+    "  • Insufficient system resources (RAM, disk space)\n"
+    "  • Network issues downloading dependencies\n"
+    "  • Malformed patch that cannot be applied\n\n"
+    "Technical details: {error_str}"
+)
+
 
 class ValidationResult:
     """Result of validating a single data point."""
@@ -56,11 +91,6 @@ class SWEBenchValidator:
         """
         self.config = config or DEFAULT_CONFIG
         self.logger = logging.getLogger(self.__class__.__name__)
-        
-        # Ensure directories exist
-        self.config.temp_dir.mkdir(parents=True, exist_ok=True)
-        self.config.log_dir.mkdir(parents=True, exist_ok=True)
-        self.config.results_dir.mkdir(parents=True, exist_ok=True)
     
     def validate_single_file(self, file_path: Path) -> ValidationResult:
         """
@@ -97,7 +127,7 @@ class SWEBenchValidator:
             
         except Exception as e:
             error_msg = f"Validation failed: {str(e)}"
-            self.logger.error(error_msg)
+            self.logger.error("Validation failed for %s: %s", file_path, e)
             
             return ValidationResult(
                 instance_id=file_path.stem,
@@ -105,6 +135,18 @@ class SWEBenchValidator:
                 error_message=error_msg
             )
     
+    def clean_harness_images(self) -> None:
+        """
+        Remove SWE-bench Docker images after a concurrent run.
+        
+        Performs the cleanup that a serial run does itself at the end of each
+        evaluation.
+        """
+        import docker
+        from swebench.harness.docker_utils import clean_images
+        
+        clean_images(docker.from_env(), set(), "none", True)
+    
     def _run_swebench_evaluation(self, instance_id: str, prediction: Dict[str, Any]) -> ValidationResult:
         """
         Run SWE-bench evaluation harness for a single instance.
@@ -120,31 +162,59 @@ class SWEBenchValidator:
         """
         self.logger.info(f"Running SWE-bench evaluation for {instance_id}")
         
+        # Get timeout for this instance
+        timeout = self.config.get_timeout_for_instance(instance_id)
+        
+        # SWE-bench imports - REAL evaluation harness (imported lazily since
+        # it pulls in datasets, docker, etc.)
+        try:
+            from swebench.harness.run_evaluation import main as run_evaluation
+        except ImportError as e:
+            self.logger.error("Could not import SWE-bench harness: %s", e)
+            return ValidationResult(
+                instance_id=instance_id,
+                success=False,
+                error_message=f"SWE-bench is not installed or failed to import: {e}"
+            )
+        
         try:
             # Create temporary predictions file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-                json.dump(prediction, f)
-                f.write('\n')
-                predictions_path = f.name
-            
-            # Get timeout for this instance
-            timeout = self.config.get_timeout_for_instance(instance_id)
+            fd, predictions_path = tempfile.mkstemp(suffix='.jsonl')
+            try:
+                # os.write may write fewer bytes than given; loop until done
+                data = memoryview(_json.dumps(prediction) + b'\n')
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             
             # Run the REAL SWE-bench evaluation harness
             self.logger.info(f"Calling swebench.harness.run_evaluation with timeout={timeout}")
             
+            # Concurrent runs share Docker images, so they keep every image they
+            # build; the caller removes them with clean_harness_images() once all
+            # workers are done. Serial runs rebuild and clean up themselves.
+            serial = not self.config.concurrent
+            
+            # The harness skips instances that already have a report under
+            # logs/run_evaluation/<run_id>/, so the run_id gets a per-invocation
+            # suffix to make every validation actually re-run the tests. The
+            # patch digest only identifies the patch in log paths.
+            patch_digest = blake2b(prediction['model_patch'].encode(), digest_size=4).hexdigest()
+            run_id = f"validation_{instance_id}_{patch_digest}_{uuid4().hex[:8]}"
+            
             # This is the ACTUAL call to SWE-bench evaluation harness - NO SIMULATION!
-            run_evaluation(
+            report_path = run_evaluation(
                 dataset_name=self.config.dataset_name,
                 split=self.config.split,
                 instance_ids=[instance_id],
                 predictions_path=predictions_path,
-                max_workers=self.config.max_workers,
-                force_rebuild=True,  # Force rebuild to test different patches
-                cache_level="none",
-                clean=True,
+                max_workers=1,  # Parallelism happens across data points
+                force_rebuild=serial,  # Force rebuild to test different patches
+                cache_level="none" if serial else "instance",
+                clean=serial,
                 open_file_limit=100,
-                run_id=f"validation_{instance_id}_{hash(prediction['model_patch']) % 10000}",
+                run_id=run_id,
                 timeout=timeout,
                 namespace=None,
                 rewrite_reports=False,
@@ -152,22 +222,18 @@ class SWEBenchValidator:
                 report_dir=str(self.config.results_dir)
             )
             
-            # Parse results from evaluation
-            # SWE-bench creates files like "gold.validation_{instance_id}_{hash}.json"
-            import glob
-            results_pattern = f"gold.validation_{instance_id}_*.json"
-            results_files = glob.glob(results_pattern)
-            
-            if not results_files:
-                # Fallback to simple pattern
-                results_file = Path(f"gold.validation_{instance_id}.json")
-            else:
-                # Use the most recent file
-                results_file = Path(sorted(results_files)[-1])
+            # Parse results from evaluation; the harness returns the path of the
+            # run report it wrote (None if it returned early)
+            if report_path is None:
+                return ValidationResult(
+                    instance_id=instance_id,
+                    success=False,
+                    error_message="SWE-bench evaluation produced no run report"
+                )
+            results_file = Path(report_path)
             
             if results_file.exists():
-                with open(results_file, 'r') as f:
-                    evaluation_results = json.load(f)
+                evaluation_results = _json.loads(results_file.read_bytes())
                 
                 # Determine success based on SWE-bench results
                 resolved_ids = evaluation_results.get("resolved_ids", [])
@@ -212,35 +278,15 @@ class SWEBenchValidator:
             
             # Create detailed error message based on error type
             if "prediction IDs not found in dataset" in error_str:
-                error_msg = f"Instance ID '{instance_id}' not found in SWE-bench dataset.\n\n"
-                error_msg += "This error occurs when:\n"
-                error_msg += "  • The instance_id doesn't exist in the official SWE-bench dataset\n"
-                error_msg += "  • There's a typo in the instance_id field\n"
-                error_msg += "  • You're using a custom instance_id not from SWE-bench\n\n"
-                error_msg += "Solution:\n"
-                error_msg += "  • Use an existing instance_id from SWE-bench dataset\n"
-                error_msg += "  • Check the instance_id spelling and format\n"
-                error_msg += f"  • Original error: {error_str}"
+                error_msg = _ERR_NOT_FOUND_TMPL.format(instance_id=instance_id, error_str=error_str)
             elif "timeout" in error_str.lower():
-                error_msg = f"SWE-bench evaluation timed out after {self.config.get_timeout_for_instance(instance_id)}s.\n\n"
-                error_msg += "This error occurs when:\n"
-                error_msg += "  • Tests take too long to execute\n"
-                error_msg += "  • Docker container becomes unresponsive\n"
-                error_msg += "  • Repository has complex dependencies\n\n"
-                error_msg += "Solution:\n"
-                error_msg += "  • Increase timeout with --timeout option\n"
-                error_msg += "  • Check Docker resources (CPU, memory)\n"
-                error_msg += f"  • Original error: {error_str}"
+                error_msg = _ERR_TIMEOUT_TMPL.format(timeout=timeout, error_str=error_str)
             else:
-                error_msg = f"SWE-bench evaluation failed.\n\n"
-                error_msg += "Common causes:\n"
-                error_msg += "  • Docker not running or not accessible\n"
-                error_msg += "  • Insufficient system resources (RAM, disk space)\n"
-                error_msg += "  • Network issues downloading dependencies\n"
-                error_msg += "  • Malformed patch that cannot be applied\n\n"
-                error_msg += f"Technical details: {error_str}"
-            
-            self.logger.error(error_msg)
+                error_msg = _ERR_GENERIC_TMPL.format(error_str=error_str)
+            
+            # Log the short form; the full explanation goes to the result
+            self.logger.error("SWE-bench evaluation failed for %s: %s", instance_id, error_str)
+            self.logger.debug("%s", error_msg)
             
             return ValidationResult(
                 instance_id=instance_id,